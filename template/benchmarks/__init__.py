@@ -0,0 +1 @@
+"""In-process benchmark suites for the service, run with ``python -m benchmarks``."""
@@ -0,0 +1,144 @@
+"""Timing, reporting and baseline checks shared by the benchmark suites."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import platform
+import time
+import timeit
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+ROUNDS = 5
+
+
+@dataclass(frozen=True)
+class Result:
+    """Report how many operations one benchmark completed and how long they took."""
+
+    name: str
+    operations: int
+    seconds: float
+
+    @property
+    def operations_per_second(self) -> float:
+        """Return the measured throughput."""
+        return self.operations / self.seconds
+
+
+@dataclass(frozen=True)
+class Regression:
+    """Report a benchmark that fell below its baseline floor."""
+
+    name: str
+    operations_per_second: float
+    floor: float
+
+
+@dataclass(frozen=True)
+class Baseline:
+    """Hold the stored throughput of each benchmark and the accepted slowdown.
+
+    A benchmark regresses when its throughput falls below its stored value
+    multiplied by ``1 - tolerance``. The tolerance absorbs the difference
+    between the machine that recorded the baseline and the one checking it.
+    """
+
+    operations_per_second: dict[str, float]
+    tolerance: float = 0.5
+
+    @classmethod
+    def load(cls, path: Path) -> Baseline:
+        """Read a baseline file; a missing file holds no baselines."""
+        if not path.exists():
+            return cls(operations_per_second={})
+        content = json.loads(path.read_text())
+        return cls(operations_per_second=content["operations_per_second"], tolerance=content["tolerance"])
+
+    def save(self, path: Path) -> None:
+        """Write the baseline file."""
+        content = {"tolerance": self.tolerance, "operations_per_second": self.operations_per_second}
+        path.write_text(json.dumps(content, indent=2, sort_keys=True) + "\n")
+
+    def updated(self, results: Sequence[Result]) -> Baseline:
+        """Return a baseline recording the throughput of ``results``, rounded to three significant digits."""
+        measured = {result.name: _round(result.operations_per_second) for result in results}
+        return Baseline(operations_per_second={**self.operations_per_second, **measured}, tolerance=self.tolerance)
+
+    def floor(self, name: str) -> float | None:
+        """Return the lowest accepted throughput of a benchmark, if it has a baseline."""
+        baseline = self.operations_per_second.get(name)
+        return None if baseline is None else baseline * (1 - self.tolerance)
+
+    def check(self, results: Sequence[Result]) -> list[Regression]:
+        """Return the results slower than their floor; benchmarks without a baseline always pass."""
+        regressions: list[Regression] = []
+        for result in results:
+            floor = self.floor(result.name)
+            if floor is not None and result.operations_per_second < floor:
+                regressions.append(Regression(result.name, result.operations_per_second, floor))
+        return regressions
+
+
+def _round(value: float) -> float:
+    """Round a throughput to three significant digits so baselines stay readable."""
+    return float(f"{value:.3g}")
+
+
+def measure(name: str, operation: Callable[[], object], calls: int, rounds: int = ROUNDS) -> Result:
+    """Time ``calls`` synchronous calls of ``operation``, keeping the fastest of ``rounds`` rounds."""
+    return Result(name, calls, min(timeit.repeat(operation, repeat=rounds, number=calls)))
+
+
+async def measure_async(
+    name: str, operation: Callable[[], Awaitable[object]], calls: int, rounds: int = ROUNDS
+) -> Result:
+    """Time ``calls`` sequential awaits of ``operation``, keeping the fastest of ``rounds`` rounds."""
+    fastest = math.inf
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(calls):
+            await operation()
+        fastest = min(fastest, time.perf_counter() - started)
+    return Result(name, calls, fastest)
+
+
+async def measure_concurrent(
+    name: str, operation: Callable[[int], Awaitable[object]], requests: int, concurrency: int
+) -> Result:
+    """Time ``requests`` awaits of ``operation(index)`` with at most ``concurrency`` in flight."""
+    indexes = iter(range(requests))
+
+    async def worker() -> None:
+        for index in indexes:
+            await operation(index)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return Result(name, requests, time.perf_counter() - started)
+
+
+def write_report(path: Path, results: Sequence[Result], baseline: Baseline) -> None:
+    """Write the results of a run, with their floors and regressions, as JSON."""
+    regressed = {regression.name for regression in baseline.check(results)}
+    content = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "tolerance": baseline.tolerance,
+        "results": [
+            {
+                "name": result.name,
+                "operations": result.operations,
+                "seconds": result.seconds,
+                "operations_per_second": result.operations_per_second,
+                "floor": baseline.floor(result.name),
+                "regressed": result.name in regressed,
+            }
+            for result in results
+        ],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(content, indent=2) + "\n")
@@ -0,0 +1,25 @@
+"""Index users by registration order.
+
+Revision ID: 20261018_0003
+Revises: 20261018_0002
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20261018_0003"
+down_revision: str | None = "20261018_0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the keyset pagination index on users."""
+    op.create_index("ix_users_created_at_id", "users", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination index on users."""
+    op.drop_index("ix_users_created_at_id", table_name="users")
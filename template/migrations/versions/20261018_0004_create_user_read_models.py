@@ -0,0 +1,44 @@
+"""Create the user read-model projection table.
+
+Revision ID: 20261018_0004
+Revises: 20261018_0003
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261018_0004"
+down_revision: str | None = "20261018_0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the user_read_models table.
+
+    The table starts empty; populate it from ``users`` with the projection
+    rebuild command before serving reads from it.
+    """
+    op.create_table(
+        "user_read_models",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("theme", sa.String(), nullable=False),
+        sa.Column("language", sa.String(), nullable=False),
+        sa.Column("marketing_enabled", sa.Boolean(), nullable=False),
+        sa.Column("backup_email", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_user_read_models_created_at_id", "user_read_models", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    """Drop the user_read_models table."""
+    op.drop_index("ix_user_read_models_created_at_id", table_name="user_read_models")
+    op.drop_table("user_read_models")
@@ -0,0 +1,26 @@
+"""Add the optimistic concurrency version to users.
+
+Revision ID: 20261018_0005
+Revises: 20261018_0004
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261018_0005"
+down_revision: str | None = "20261018_0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the users.version column; existing rows start at version 1."""
+    op.add_column("users", sa.Column("version", sa.Integer(), server_default="1", nullable=False))
+
+
+def downgrade() -> None:
+    """Drop the users.version column."""
+    op.drop_column("users", "version")
@@ -0,0 +1,66 @@
+"""Index user settings for segment queries.
+
+Revision ID: 20261018_0006
+Revises: 20261018_0005
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "20261018_0006"
+down_revision: str | None = "20261018_0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Store users.settings as JSONB on PostgreSQL and index the filtered settings.
+
+    PostgreSQL gets a GIN index answering containment on any settings key;
+    SQLite gets an expression index on ``marketing_enabled``. The flat
+    projection indexes its ``marketing_enabled`` column on both.
+    """
+    if op.get_bind().dialect.name == "postgresql":
+        op.alter_column(
+            "users",
+            "settings",
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            existing_nullable=False,
+            postgresql_using="settings::jsonb",
+        )
+        op.create_index(
+            "ix_users_settings",
+            "users",
+            ["settings"],
+            postgresql_using="gin",
+            postgresql_ops={"settings": "jsonb_path_ops"},
+        )
+    else:
+        op.create_index(
+            "ix_users_settings_marketing_enabled",
+            "users",
+            [sa.text("json_extract(settings, '$.marketing_enabled')"), "is_active"],
+        )
+    op.create_index("ix_user_read_models_marketing_enabled", "user_read_models", ["marketing_enabled", "is_active"])
+
+
+def downgrade() -> None:
+    """Drop the settings indexes and store users.settings as JSON again."""
+    op.drop_index("ix_user_read_models_marketing_enabled", table_name="user_read_models")
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_users_settings", table_name="users")
+        op.alter_column(
+            "users",
+            "settings",
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=False,
+            postgresql_using="settings::json",
+        )
+    else:
+        op.drop_index("ix_users_settings_marketing_enabled", table_name="users")
@@ -0,0 +1,56 @@
+"""Create the user embeddings table for similarity search.
+
+Revision ID: 20261018_0007
+Revises: 20261018_0006
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from pgvector.sqlalchemy import Vector
+
+revision: str = "20261018_0007"
+down_revision: str | None = "20261018_0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Frozen at the dimension the table was created with; changing it takes a new migration.
+EMBEDDING_DIMENSIONS = 384
+
+
+def upgrade() -> None:
+    """Create the user_embeddings table.
+
+    On PostgreSQL the pgvector extension is installed first and the
+    embeddings get an HNSW index over cosine distance. Other databases store
+    the vectors as text and search them in memory.
+    """
+    postgresql = op.get_bind().dialect.name == "postgresql"
+    if postgresql:
+        op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    op.create_table(
+        "user_embeddings",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("embedding", Vector(EMBEDDING_DIMENSIONS), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    if postgresql:
+        op.create_index(
+            "ix_user_embeddings_embedding",
+            "user_embeddings",
+            ["embedding"],
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Drop the user_embeddings table; the vector extension stays installed."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_user_embeddings_embedding", table_name="user_embeddings")
+    op.drop_table("user_embeddings")
@@ -0,0 +1,31 @@
+"""Add the version of the projected user to user read models.
+
+Revision ID: 20261018_0009
+Revises: 20261018_0008
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261018_0009"
+down_revision: str | None = "20261018_0008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the user_read_models.version column and copy each row's version from users."""
+    op.add_column("user_read_models", sa.Column("version", sa.Integer(), server_default="1", nullable=False))
+    op.execute(
+        "UPDATE user_read_models SET version = "
+        "(SELECT users.version FROM users WHERE users.id = user_read_models.id) "
+        "WHERE EXISTS (SELECT 1 FROM users WHERE users.id = user_read_models.id)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the user_read_models.version column."""
+    op.drop_column("user_read_models", "version")
@@ -0,0 +1,131 @@
+"""Helpers for Alembic revisions that change large tables without downtime.
+
+Revisions call these from ``upgrade`` and ``downgrade``. Each helper also
+renders plain SQL when Alembic runs offline with ``--sql``.
+"""
+
+import logging
+import time
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+from alembic import op
+from sqlalchemy import ColumnElement, Connection, TableClause, TextClause, select, text, update
+from sqlalchemy.exc import DBAPIError
+
+# Progress is reported through Alembic's own logger, which ``alembic.ini`` shows at INFO.
+log = logging.getLogger("alembic.runtime.migration")
+
+
+def set_timeouts(
+    connection: Connection, *, lock_timeout: float | None = None, statement_timeout: float | None = None
+) -> None:
+    """Bound how long statements on ``connection`` wait for locks and run.
+
+    A statement waiting longer than ``lock_timeout`` for a lock fails instead
+    of queueing every later query on the table behind it. The limits hold for
+    the session, including statements run outside the migration's
+    transaction; ``migrations/env.py`` restores the configured ones after
+    every migration. Zero disables a limit and ``None`` keeps the current
+    one. Only PostgreSQL supports these limits; other databases ignore them.
+
+    Args:
+        connection: The migration connection, such as ``op.get_bind()``.
+        lock_timeout: Seconds a statement may wait for a lock.
+        statement_timeout: Seconds a statement may run.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    for setting, seconds in (("lock_timeout", lock_timeout), ("statement_timeout", statement_timeout)):
+        if seconds is not None:
+            connection.execute(text(f"SET {setting} = {round(seconds * 1000)}"))
+
+
+def create_index_concurrently(
+    index_name: str, table_name: str, columns: Sequence[str | TextClause], **kwargs: Any
+) -> None:
+    """Create an index without blocking writes to its table.
+
+    On PostgreSQL the index is built with ``CREATE INDEX CONCURRENTLY``,
+    which cannot run inside a transaction, so the migration's transaction is
+    committed first. A failed concurrent build leaves an invalid index
+    behind; it is dropped before the error propagates, so the revision can be
+    run again. Other databases create the index as usual.
+
+    Args:
+        index_name: The name of the index.
+        table_name: The table to index.
+        columns: Column names or expressions, as for ``op.create_index``.
+        **kwargs: Further ``op.create_index`` options, such as ``unique`` or
+            ``postgresql_where``.
+    """
+    with op.get_context().autocommit_block():
+        try:
+            op.create_index(index_name, table_name, list(columns), postgresql_concurrently=True, **kwargs)
+        except DBAPIError:
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
+            raise
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    """Drop an index without blocking reads and writes to its table on PostgreSQL."""
+    with op.get_context().autocommit_block():
+        op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True)
+
+
+def backfill(
+    table: TableClause,
+    values: Mapping[str, Any],
+    pending: ColumnElement[bool],
+    *,
+    key: str = "id",
+    batch_size: int = 1000,
+    pause: float = 0.0,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    """Update the rows matching ``pending`` in primary-key ranges, committing each range on its own.
+
+    Each batch selects the next ``batch_size`` pending keys and updates the
+    pending rows of that key range, so it locks only those rows and only
+    until it commits. The update must make its rows stop matching
+    ``pending``; a rerun after an interruption then resumes where the last
+    committed batch ended. Like ``create_index_concurrently``, the
+    migration's transaction is committed first. Offline ``--sql`` runs render
+    a single ``UPDATE`` instead.
+
+    Args:
+        table: The table to update, such as ``sa.table("users", sa.column("id"), ...)``.
+        values: The new values by column name; SQL expressions may refer to
+            the row being updated.
+        pending: Selects the rows that still need the update.
+        key: The name of the primary-key column that orders the batches.
+        batch_size: The number of rows updated per batch.
+        pause: Seconds to wait between batches, leaving the database time
+            for production traffic and replicas time to catch up.
+        sleep: Waits between batches; replaced in tests.
+
+    Returns:
+        The number of rows updated, or zero for offline runs.
+    """
+    context = op.get_context()
+    column = table.c[key]
+    if context.as_sql:
+        op.execute(update(table).where(pending).values(values))
+        return 0
+    updated = 0
+    with context.autocommit_block():
+        connection = op.get_bind()
+        keys = connection.scalars(select(column).where(pending).order_by(column).limit(batch_size)).all()
+        while keys:
+            result = connection.execute(
+                update(table).where(column >= keys[0], column <= keys[-1], pending).values(values)
+            )
+            updated += result.rowcount
+            log.info("Backfilled %d rows of %s through %s %s.", updated, table.name, key, keys[-1])
+            if len(keys) < batch_size:
+                break
+            query = select(column).where(column > keys[-1], pending).order_by(column).limit(batch_size)
+            keys = connection.scalars(query).all()
+            if keys:
+                sleep(pause)
+    return updated
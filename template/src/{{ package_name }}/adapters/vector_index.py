@@ -0,0 +1,77 @@
+"""In-memory vector similarity search."""
+
+from collections.abc import Collection, Iterable, Sequence
+from uuid import UUID
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+def _normalized(vectors: NDArray[np.float32]) -> NDArray[np.float32]:
+    """Scale vectors to unit length along their last axis, leaving zero vectors at zero."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+class InMemoryVectorIndex:
+    """Answer cosine top-k queries by brute force over an in-memory NumPy matrix.
+
+    Vectors are stored at unit length, one ``float32`` row per key, so scoring
+    every row is a single matrix-vector product and picking the best ``k`` is
+    a partial sort. Results are exact, and fast enough for the offline test
+    tier and SQLite-sized data; large tables belong behind an approximate
+    index in the database. ``load`` replaces the indexed vectors as a whole.
+    """
+
+    def __init__(self, dimensions: int):
+        """Initialize an empty index.
+
+        Args:
+            dimensions: Length of every indexed vector.
+        """
+        self.dimensions = dimensions
+        self.version: object = None
+        self._keys: tuple[UUID, ...] = ()
+        self._positions: dict[UUID, int] = {}
+        self._matrix: NDArray[np.float32] = np.empty((0, dimensions), dtype=np.float32)
+
+    def __len__(self) -> int:
+        """Return the number of indexed vectors."""
+        return len(self._keys)
+
+    def load(self, vectors: Iterable[tuple[UUID, Sequence[float]]], version: object = None) -> None:
+        """Replace the indexed vectors, recording the ``version`` of the data they were read from."""
+        keys: list[UUID] = []
+        rows: list[Sequence[float]] = []
+        for key, vector in vectors:
+            keys.append(key)
+            rows.append(vector)
+        matrix = np.asarray(rows, dtype=np.float32).reshape(len(rows), self.dimensions)
+        self._keys = tuple(keys)
+        self._positions = {key: position for position, key in enumerate(keys)}
+        self._matrix = _normalized(matrix)
+        self.version = version
+
+    def nearest(
+        self, vector: Sequence[float], k: int, among: Collection[UUID] | None = None
+    ) -> list[tuple[UUID, float]]:
+        """Return up to ``k`` keys with their cosine similarity to ``vector``, most similar first.
+
+        Args:
+            vector: The query vector.
+            k: Maximum number of keys returned.
+            among: Only rank these keys. Defaults to every indexed key.
+        """
+        matrix = self._matrix
+        positions = None
+        if among is not None:
+            positions = np.fromiter((self._positions[key] for key in among if key in self._positions), dtype=np.intp)
+            matrix = matrix[positions]
+        scores = matrix @ _normalized(np.asarray(vector, dtype=np.float32))
+        if k < scores.size:
+            best = np.argpartition(-scores, k - 1)[:k]
+            best = best[np.argsort(-scores[best], kind="stable")]
+        else:
+            best = np.argsort(-scores, kind="stable")
+        rows = best if positions is None else positions[best]
+        return [(self._keys[row], float(scores[rank])) for row, rank in zip(rows, best, strict=True)]
@@ -1,9 +1,12 @@
 """Pydantic schemas used at application boundaries."""
 
+from datetime import datetime
 from typing import Literal
 
+from fastapi import status
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.alias_generators import to_camel
+from starlette.responses import Response
 
 
 class CamelCaseModel(BaseModel):
@@ -24,13 +27,50 @@ class ResponseModel[S: CamelCaseModel](CamelCaseModel):
     data: S | list[S] = Field(description="The response data.")
 
 
+class PageResponseModel[S: CamelCaseModel](CamelCaseModel):
+    """Wrap one page of API response data."""
+
+    data: list[S] = Field(description="The response data.")
+    next_cursor: str | None = Field(
+        default=None, description="Opaque cursor that requests the next page, absent on the last page."
+    )
+
+
+def trusted_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize a response model built from trusted data straight to JSON.
+
+    FastAPI validates whatever a route returns against its ``response_model``
+    before serializing it. Routes whose responses are built from read models,
+    which were validated when the data entered the system, return this
+    response instead: the model's compiled serializer writes the same
+    camelCase JSON in one pass, and the route's ``response_model`` still
+    documents the schema.
+    """
+    return Response(model.model_dump_json(), status_code=status_code, media_type="application/json")
+
+
 class LivenessProbed(CamelCaseModel):
     """Represent a successful application liveness probe."""
 
     status: Literal["Ok", "Error"] = Field(description="The status of the application.", default="Ok")
 
 
+class EngineProbed(CamelCaseModel):
+    """Represent the latest background health check of one database engine."""
+
+    status: Literal["Ready", "Error"] = Field(description="The settled health of the engine.")
+    checked_at: datetime = Field(description="When the engine was last checked.")
+    pool_saturation: float = Field(
+        description="Share of the connection pool lent out at the last check; above 1 while overflowing."
+    )
+
+
 class ReadinessProbed(CamelCaseModel):
     """Represent a successful application readiness probe."""
 
-    status: Literal["Ready", "Error"] = Field(description="The readiness probe of the application.", default="Ready")
+    status: Literal["Ready", "Warming", "Error"] = Field(
+        description="The readiness probe of the application.", default="Ready"
+    )
+    engines: dict[str, EngineProbed] = Field(
+        default_factory=dict, description="The latest health check of each database engine, by name."
+    )
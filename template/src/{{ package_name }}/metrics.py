@@ -0,0 +1,197 @@
+"""In-process metrics rendered in the Prometheus text exposition format.
+
+Instruments are plain Python objects. Updates take no locks because each
+process runs one event loop and no update awaits, so they cost a dictionary
+lookup and an addition on the request path. Values are per process; scrape
+every worker, or aggregate across them, in the monitoring system.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = tuple[str, ...]
+
+
+class DuplicateMetric(ValueError):
+    """Raised when a metric name is registered again as a different kind."""
+
+    def __init__(self, name: str):
+        """Initialize the error for a conflicting metric name."""
+        super().__init__(f"Metric {name} is already registered as a different kind")
+
+
+def _format_labels(names: Labels, values: Labels) -> str:
+    """Render a label set, escaping values as the exposition format requires."""
+    if not names:
+        return ""
+    escaped = (value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n") for value in values)
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(names, escaped, strict=True)) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value."""
+    return "+Inf" if value == math.inf else repr(float(value))
+
+
+class Counter:
+    """Count events that only ever increase, per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()):
+        """Initialize the counter.
+
+        Args:
+            name: Metric name, ending in ``_total`` by convention.
+            documentation: Help text exposed with the metric.
+            labelnames: Names of the labels every update supplies, in order.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[Labels, float] = {} if labelnames else {(): 0.0}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Add ``amount`` to the counter for a label set."""
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Return the current count for a label set."""
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterator[str]:
+        """Yield exposition lines for every label set."""
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Histogram:
+    """Count observations into cumulative buckets, per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Labels = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name, ending in the observed unit by convention.
+            documentation: Help text exposed with the metric.
+            labelnames: Names of the labels every observation supplies, in order.
+            buckets: Increasing upper bounds; ``+Inf`` is always appended.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._series: dict[Labels, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record one observation for a label set."""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = series
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def count(self, *labels: str) -> int:
+        """Return the number of observations for a label set."""
+        series = self._series.get(labels)
+        return 0 if series is None else sum(series[0])
+
+    def samples(self) -> Iterator[str]:
+        """Yield cumulative bucket, sum and count lines for every label set."""
+        names = (*self.labelnames, "le")
+        for labels, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                yield f"{self.name}_bucket{_format_labels(names, (*labels, _format_value(bound)))} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total[0])}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}"
+
+
+class Gauge:
+    """Report values read from callbacks when the registry is rendered."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()):
+        """Initialize the gauge.
+
+        Args:
+            name: Metric name.
+            documentation: Help text exposed with the metric.
+            labelnames: Names of the labels identifying each tracked callback.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._callbacks: dict[Labels, Callable[[], float]] = {}
+
+    def track(self, collect: Callable[[], float], *labels: str) -> None:
+        """Report the value returned by ``collect`` for a label set."""
+        self._callbacks[labels] = collect
+
+    def value(self, *labels: str) -> float:
+        """Return the current value for a label set."""
+        return self._callbacks[labels]()
+
+    def samples(self) -> Iterator[str]:
+        """Yield the current value of every tracked label set."""
+        for labels, collect in self._callbacks.items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(collect())}"
+
+
+Metric = Counter | Histogram | Gauge
+
+
+class MetricsRegistry:
+    """Hold the metrics of one process and render them for scraping."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, Metric] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: Labels = ()) -> Counter:
+        """Register a counter, or return the one already registered under ``name``."""
+        return self._register(Counter(name, documentation, labelnames), Counter)
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Labels = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Register a histogram, or return the one already registered under ``name``."""
+        return self._register(Histogram(name, documentation, labelnames, buckets), Histogram)
+
+    def gauge(self, name: str, documentation: str, labelnames: Labels = ()) -> Gauge:
+        """Register a gauge, or return the one already registered under ``name``."""
+        return self._register(Gauge(name, documentation, labelnames), Gauge)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+    def _register[M: Metric](self, metric: M, kind: type[M]) -> M:
+        """Store a new metric, or return the existing metric of the same kind and name.
+
+        Raises:
+            DuplicateMetric: If ``name`` is already registered as another kind.
+        """
+        existing = self._metrics.setdefault(metric.name, metric)
+        if not isinstance(existing, kind):
+            raise DuplicateMetric(metric.name)
+        return existing
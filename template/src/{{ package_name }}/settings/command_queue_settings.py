@@ -0,0 +1,39 @@
+"""Durable command queue settings."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class CommandQueueSettings(BaseSettings):
+    """Configure the durable command queue and its worker.
+
+    Environment variables:
+        * COMMAND_QUEUE_MAX_PENDING
+        * COMMAND_QUEUE_BATCH_SIZE
+        * COMMAND_QUEUE_CONCURRENCY
+        * COMMAND_QUEUE_POLL_INTERVAL
+        * COMMAND_QUEUE_LEASE
+        * COMMAND_QUEUE_MAX_ATTEMPTS
+
+    Attributes:
+        MAX_PENDING (int): Unfinished jobs beyond which new commands are
+            refused, so callers back off. Zero means unbounded.
+        BATCH_SIZE (int): Maximum number of jobs a worker claims per
+            transaction.
+        CONCURRENCY (int): Maximum number of commands a worker runs at once.
+        POLL_INTERVAL (float): Seconds a worker waits for new jobs once the
+            queue is drained.
+        LEASE (float): Seconds a claimed job may run before another worker
+            may claim it again.
+        MAX_ATTEMPTS (int): Maximum number of times a job is run before it
+            fails.
+    """
+
+    MAX_PENDING: int = Field(default=10_000, ge=0)
+    BATCH_SIZE: int = Field(default=50, ge=1)
+    CONCURRENCY: int = Field(default=10, ge=1)
+    POLL_INTERVAL: float = Field(default=1.0, gt=0)
+    LEASE: float = Field(default=300.0, gt=0)
+    MAX_ATTEMPTS: int = Field(default=3, ge=1)
+
+    model_config = SettingsConfigDict(case_sensitive=True, env_prefix="COMMAND_QUEUE_")
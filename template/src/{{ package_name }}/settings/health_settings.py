@@ -0,0 +1,31 @@
+"""Database health check settings."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class HealthSettings(BaseSettings):
+    """Configure the background database health checks behind readiness.
+
+    Environment variables:
+        * HEALTH_INTERVAL
+        * HEALTH_TIMEOUT
+        * HEALTH_FAILURE_THRESHOLD
+        * HEALTH_RECOVERY_THRESHOLD
+
+    Attributes:
+        INTERVAL (float): Seconds between two rounds of checks.
+        TIMEOUT (float): Seconds a check may take, including the wait for a
+            pooled connection, before it counts as failed.
+        FAILURE_THRESHOLD (int): Consecutive failed checks before a ready
+            database is reported as failed.
+        RECOVERY_THRESHOLD (int): Consecutive successful checks before a
+            failed database is reported as ready again.
+    """
+
+    INTERVAL: float = Field(default=5.0, gt=0)
+    TIMEOUT: float = Field(default=2.0, gt=0)
+    FAILURE_THRESHOLD: int = Field(default=3, ge=1)
+    RECOVERY_THRESHOLD: int = Field(default=2, ge=1)
+
+    model_config = SettingsConfigDict(case_sensitive=True, env_prefix="HEALTH_")
@@ -0,0 +1,39 @@
+"""Message bus settings."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class MessageBusSettings(BaseSettings):
+    """Configure command and event dispatch.
+
+    Environment variables:
+        * MESSAGEBUS_EVENT_WORKERS
+        * MESSAGEBUS_EVENT_QUEUE_SIZE
+        * MESSAGEBUS_EVENT_HANDLER_TIMEOUT
+        * MESSAGEBUS_COMMAND_RETRIES
+        * MESSAGEBUS_RETRY_BACKOFF
+        * MESSAGEBUS_RETRY_BACKOFF_MAX
+
+    Attributes:
+        EVENT_WORKERS (int): Background workers handling domain events off the
+            request path. Zero handles events inline before a command returns.
+        EVENT_QUEUE_SIZE (int): Maximum number of events waiting for a worker.
+            Zero means unbounded.
+        EVENT_HANDLER_TIMEOUT (float | None): Seconds one event handler may run
+            before it is cancelled. Unset waits indefinitely.
+        COMMAND_RETRIES (int): Times a command is rerun against fresh state
+            after another transaction changed the aggregate it wrote.
+        RETRY_BACKOFF (float): Upper bound, in seconds, of the random delay
+            before the first retry. It doubles with every further retry.
+        RETRY_BACKOFF_MAX (float): Largest bound, in seconds, of a retry delay.
+    """
+
+    EVENT_WORKERS: int = Field(default=0, ge=0)
+    EVENT_QUEUE_SIZE: int = Field(default=1000, ge=0)
+    EVENT_HANDLER_TIMEOUT: float | None = Field(default=30.0, gt=0)
+    COMMAND_RETRIES: int = Field(default=3, ge=0)
+    RETRY_BACKOFF: float = Field(default=0.01, ge=0)
+    RETRY_BACKOFF_MAX: float = Field(default=0.5, ge=0)
+
+    model_config = SettingsConfigDict(case_sensitive=True, env_prefix="MESSAGEBUS_")
@@ -0,0 +1,31 @@
+"""Database migration settings."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class MigrationSettings(BaseSettings):
+    """Configure how Alembic revisions wait for locks and pace backfills.
+
+    Environment variables:
+        * MIGRATION_LOCK_TIMEOUT
+        * MIGRATION_STATEMENT_TIMEOUT
+        * MIGRATION_BACKFILL_BATCH_SIZE
+        * MIGRATION_BACKFILL_PAUSE
+
+    Attributes:
+        LOCK_TIMEOUT (float): Seconds a migration statement waits for a lock
+            on PostgreSQL before failing, so it never queues production
+            queries behind it for long; zero waits indefinitely.
+        STATEMENT_TIMEOUT (float): Seconds a migration statement may run on
+            PostgreSQL; zero for no limit.
+        BACKFILL_BATCH_SIZE (int): Rows a backfill updates per committed batch.
+        BACKFILL_PAUSE (float): Seconds a backfill waits between batches.
+    """
+
+    LOCK_TIMEOUT: float = Field(default=5.0, ge=0)
+    STATEMENT_TIMEOUT: float = Field(default=0.0, ge=0)
+    BACKFILL_BATCH_SIZE: int = Field(default=1000, ge=1)
+    BACKFILL_PAUSE: float = Field(default=0.0, ge=0)
+
+    model_config = SettingsConfigDict(case_sensitive=True, env_prefix="MIGRATION_")
@@ -0,0 +1,33 @@
+"""Transactional outbox settings."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class OutboxSettings(BaseSettings):
+    """Configure the transactional outbox and its relay.
+
+    Environment variables:
+        * OUTBOX_ENABLED
+        * OUTBOX_BATCH_SIZE
+        * OUTBOX_POLL_INTERVAL
+        * OUTBOX_MAX_ATTEMPTS
+
+    Attributes:
+        ENABLED (bool): Write domain events to the outbox table in the same
+            transaction as the aggregate changes, and publish them externally
+            from a background relay instead of in-process handlers.
+        BATCH_SIZE (int): Maximum number of outbox rows the relay claims per
+            transaction.
+        POLL_INTERVAL (float): Seconds the relay waits for new rows once the
+            outbox is drained.
+        MAX_ATTEMPTS (int): Maximum number of times a row is published before
+            the relay parks it.
+    """
+
+    ENABLED: bool = False
+    BATCH_SIZE: int = Field(default=100, ge=1)
+    POLL_INTERVAL: float = Field(default=1.0, gt=0)
+    MAX_ATTEMPTS: int = Field(default=5, ge=1)
+
+    model_config = SettingsConfigDict(case_sensitive=True, env_prefix="OUTBOX_")
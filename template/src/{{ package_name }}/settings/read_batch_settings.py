@@ -0,0 +1,28 @@
+"""Read batch settings."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class ReadBatchSettings(BaseSettings):
+    """Configure batching of concurrent user lookups.
+
+    Environment variables:
+        * READ_BATCH_ENABLED
+        * READ_BATCH_MAX_SIZE
+        * READ_BATCH_WINDOW
+
+    Attributes:
+        ENABLED (bool): Load concurrent user lookups together with one
+            ``IN`` query, sharing the load of identities looked up twice.
+        MAX_SIZE (int): Maximum number of users loaded by one query.
+        WINDOW (float): Seconds a batch waits for more lookups after its first
+            one. Zero batches the lookups issued in the same event loop
+            iteration without delaying any of them.
+    """
+
+    ENABLED: bool = False
+    MAX_SIZE: int = Field(default=100, ge=1)
+    WINDOW: float = Field(default=0.0, ge=0)
+
+    model_config = SettingsConfigDict(case_sensitive=True, env_prefix="READ_BATCH_")
@@ -0,0 +1,31 @@
+"""Read cache settings."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class ReadCacheSettings(BaseSettings):
+    """Configure the in-process user read cache.
+
+    Environment variables:
+        * READ_CACHE_ENABLED
+        * READ_CACHE_MAX_SIZE
+        * READ_CACHE_TTL
+        * READ_CACHE_NEGATIVE_TTL
+
+    Attributes:
+        ENABLED (bool): Serve user lookups from a bounded in-process cache that
+            domain events invalidate.
+        MAX_SIZE (int): Maximum number of cached users. The least recently used
+            entry is evicted beyond it.
+        TTL (float): Seconds a found user stays cached. This bounds how stale
+            a read can be after another process changes the user.
+        NEGATIVE_TTL (float): Seconds a lookup of an unknown user stays cached.
+    """
+
+    ENABLED: bool = False
+    MAX_SIZE: int = Field(default=10_000, ge=1)
+    TTL: float = Field(default=30.0, gt=0)
+    NEGATIVE_TTL: float = Field(default=5.0, gt=0)
+
+    model_config = SettingsConfigDict(case_sensitive=True, env_prefix="READ_CACHE_")
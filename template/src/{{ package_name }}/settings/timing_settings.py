@@ -0,0 +1,29 @@
+"""Request timing settings."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class TimingSettings(BaseSettings):
+    """Configure per-request timing spans and the slow-operation log.
+
+    Environment variables:
+        * TIMING_ENABLED
+        * TIMING_SLOW_SPAN_THRESHOLD
+        * TIMING_SLOW_REQUEST_THRESHOLD
+
+    Attributes:
+        ENABLED (bool): Time the message bus, units of work, repositories
+            and SQL statements of every request, and report the breakdown
+            in a ``Server-Timing`` response header.
+        SLOW_SPAN_THRESHOLD (float): Seconds from which a single timed
+            operation is logged as slow.
+        SLOW_REQUEST_THRESHOLD (float): Seconds from which a request is
+            logged as slow, with its breakdown.
+    """
+
+    ENABLED: bool = False
+    SLOW_SPAN_THRESHOLD: float = Field(default=0.1, gt=0)
+    SLOW_REQUEST_THRESHOLD: float = Field(default=0.5, gt=0)
+
+    model_config = SettingsConfigDict(case_sensitive=True, env_prefix="TIMING_")
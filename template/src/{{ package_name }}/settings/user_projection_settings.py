@@ -0,0 +1,23 @@
+"""User projection settings."""
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class UserProjectionSettings(BaseSettings):
+    """Configure the denormalized ``user_read_models`` projection.
+
+    Environment variables:
+        * USER_PROJECTION_MAINTAIN
+        * USER_PROJECTION_SERVE_READS
+
+    Attributes:
+        MAINTAIN (bool): Re-project users into ``user_read_models`` whenever a
+            ``UserRegistered`` or ``UserDeactivated`` event is handled.
+        SERVE_READS (bool): Answer user queries from the projection instead of
+            the write-side ``users`` table. Implies ``MAINTAIN``.
+    """
+
+    MAINTAIN: bool = False
+    SERVE_READS: bool = False
+
+    model_config = SettingsConfigDict(case_sensitive=True, env_prefix="USER_PROJECTION_")
@@ -2,12 +2,19 @@
 Uvicorn settings
 """
 
+import os
 from ipaddress import ip_address
+from typing import Literal
 
-from pydantic import IPvAnyAddress
+from pydantic import Field, IPvAnyAddress
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _default_workers() -> int:
+    """Return one worker per CPU of the machine."""
+    return os.cpu_count() or 1
+
+
 class UvicornSettings(BaseSettings):
     """Define UVICORN configuration model.
 
@@ -20,21 +27,50 @@ class UvicornSettings(BaseSettings):
         * UVICORN_PORT
         * UVICORN_LOG_LEVEL
         * UVICORN_RELOAD
+        * UVICORN_WORKERS
+        * UVICORN_LOOP
+        * UVICORN_HTTP
+        * UVICORN_BACKLOG
+        * UVICORN_TIMEOUT_KEEP_ALIVE
+        * UVICORN_LIMIT_CONCURRENCY
+        * UVICORN_TIMEOUT_GRACEFUL_SHUTDOWN
 
     Attributes:
         HOST (IPvAnyAddress): Host to run application on.
         PORT (int): Port to run application on.
         LOG_LEVEL (str): Logging level.
-        RELOAD (bool): Enable/disable auto-reload.
+        RELOAD (bool): Enable/disable auto-reload. Reload runs a single
+            process, so WORKERS is ignored while it is enabled.
+        WORKERS (int): Number of worker processes. Defaults to the number of
+            CPUs of the machine, which ignores container CPU limits.
+        LOOP (str): Event loop implementation; ``auto`` picks uvloop when it
+            is installed.
+        HTTP (str): HTTP/1.1 parser implementation; ``auto`` picks httptools
+            when it is installed.
+        BACKLOG (int): Maximum number of connections waiting to be accepted.
+        TIMEOUT_KEEP_ALIVE (int): Seconds an idle keep-alive connection is
+            held open.
+        LIMIT_CONCURRENCY (int | None): Connections or tasks a worker accepts
+            before answering 503, or ``None`` for no limit.
+        TIMEOUT_GRACEFUL_SHUTDOWN (int | None): Seconds a worker waits for
+            in-flight requests on shutdown, or ``None`` to wait indefinitely.
 
     Resources:
         1. https://docs.pydantic.dev/latest/usage/pydantic_settings/
+        2. https://www.uvicorn.org/settings/
     """
 
     HOST: IPvAnyAddress = ip_address("127.0.0.1")
     PORT: int = 8000
     LOG_LEVEL: str = "info"
     RELOAD: bool = False
+    WORKERS: int = Field(default_factory=_default_workers, ge=1)
+    LOOP: Literal["auto", "asyncio", "uvloop"] = "auto"
+    HTTP: Literal["auto", "h11", "httptools"] = "auto"
+    BACKLOG: int = Field(default=2048, ge=1)
+    TIMEOUT_KEEP_ALIVE: int = Field(default=5, ge=0)
+    LIMIT_CONCURRENCY: int | None = Field(default=None, ge=1)
+    TIMEOUT_GRACEFUL_SHUTDOWN: int | None = Field(default=30, ge=0)
 
     model_config = SettingsConfigDict(
         case_sensitive=True,
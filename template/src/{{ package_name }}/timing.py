@@ -0,0 +1,174 @@
+"""Per-request timing spans tracked through a context variable.
+
+``RequestTimer.timeline`` starts a ``Timeline`` for the current task and the
+tasks it creates. Instrumented code wraps its work in ``span(name)``, which
+adds the elapsed time to the active timeline under ``name``. Without an
+active timeline ``span`` returns a shared no-op, so instrumentation costs one
+context variable lookup while timing is disabled.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections.abc import Generator
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+log = logging.getLogger(__name__)
+
+_TIMELINE: ContextVar[Timeline | None] = ContextVar("timeline", default=None)
+
+
+@dataclass(slots=True)
+class SpanTotal:
+    """Accumulate the spans of one name."""
+
+    count: int = 0
+    seconds: float = 0.0
+
+
+class Timeline:
+    """Collect the spans of one request, totalled by name.
+
+    Spans may nest, such as SQL statements inside a commit inside a command,
+    so totals overlap and do not add up to the elapsed time. Any single span
+    at or above ``slow_span_threshold`` seconds is logged as it ends.
+    """
+
+    def __init__(self, label: str, slow_span_threshold: float = math.inf):
+        """Initialize an empty timeline starting now.
+
+        Args:
+            label: Names the timed work in logs, such as ``POST /api/v1/users``.
+            slow_span_threshold: Seconds from which a single span is logged.
+        """
+        self.label = label
+        self.slow_span_threshold = slow_span_threshold
+        self.started = time.perf_counter()
+        self.spans: dict[str, SpanTotal] = {}
+
+    def record(self, name: str, seconds: float, detail: str = "") -> None:
+        """Add a finished span, logging it when it is slow.
+
+        Args:
+            name: Groups the span with the others of its kind.
+            seconds: How long the span took.
+            detail: Identifies the span in the slow-operation log, such as a
+                message type or a SQL statement.
+        """
+        total = self.spans.get(name)
+        if total is None:
+            total = self.spans[name] = SpanTotal()
+        total.count += 1
+        total.seconds += seconds
+        if seconds >= self.slow_span_threshold:
+            milliseconds = round(seconds * 1000, 1)
+            log.warning(
+                "Slow %s in %s took %.1f ms: %s",
+                name,
+                self.label,
+                milliseconds,
+                detail,
+                extra={"span": name, "request": self.label, "duration_ms": milliseconds, "detail": detail},
+            )
+
+    def elapsed(self) -> float:
+        """Return the seconds since the timeline started."""
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """Render the span totals and the elapsed time as a ``Server-Timing`` header value.
+
+        Each entry is ``<name>;dur=<milliseconds>;desc="<count>x"``, followed
+        by ``total;dur=<milliseconds>``.
+        """
+        entries = [f'{name};dur={total.seconds * 1000:.1f};desc="{total.count}x"' for name, total in self.spans.items()]
+        entries.append(f"total;dur={self.elapsed() * 1000:.1f}")
+        return ", ".join(entries)
+
+
+class _Span:
+    """Time one span of the active timeline."""
+
+    __slots__ = ("detail", "name", "started", "timeline")
+
+    def __init__(self, timeline: Timeline, name: str, detail: str):
+        """Initialize a span that is not started yet."""
+        self.timeline = timeline
+        self.name = name
+        self.detail = detail
+        self.started = 0.0
+
+    def __enter__(self) -> None:
+        """Start the span."""
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Record the span, whether or not the timed work raised."""
+        self.timeline.record(self.name, time.perf_counter() - self.started, self.detail)
+
+
+class _NoSpan:
+    """Stand in for a span while no timeline is active."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        """Do nothing."""
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Do nothing."""
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name: str, detail: str = "") -> AbstractContextManager[None]:
+    """Return a context manager that times its block as a span of the active timeline, if any."""
+    timeline = _TIMELINE.get()
+    return _NO_SPAN if timeline is None else _Span(timeline, name, detail)
+
+
+def record(name: str, seconds: float, detail: str = "") -> None:
+    """Add a span measured elsewhere to the active timeline, if any."""
+    timeline = _TIMELINE.get()
+    if timeline is not None:
+        timeline.record(name, seconds, detail)
+
+
+@dataclass(frozen=True)
+class RequestTimer:
+    """Start timelines and log the slow ones.
+
+    Attributes:
+        slow_span_threshold: Seconds from which a single span is logged.
+        slow_request_threshold: Seconds from which a whole timeline is logged
+            with its breakdown when it ends.
+    """
+
+    slow_span_threshold: float = math.inf
+    slow_request_threshold: float = math.inf
+
+    @contextmanager
+    def timeline(self, label: str) -> Generator[Timeline]:
+        """Make a new timeline active for the enclosed block and the tasks it creates."""
+        timeline = Timeline(label, self.slow_span_threshold)
+        token = _TIMELINE.set(timeline)
+        try:
+            yield timeline
+        finally:
+            _TIMELINE.reset(token)
+            seconds = timeline.elapsed()
+            if seconds >= self.slow_request_threshold:
+                milliseconds = round(seconds * 1000, 1)
+                breakdown = timeline.server_timing()
+                log.warning(
+                    "Slow request %s took %.1f ms: %s",
+                    label,
+                    milliseconds,
+                    breakdown,
+                    extra={"request": label, "duration_ms": milliseconds, "breakdown": breakdown},
+                )
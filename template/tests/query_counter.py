@@ -0,0 +1,104 @@
+"""Query counting for test budgets.
+
+Tests bound the statements a block sends to the database, so an N+1 pattern
+or an extra lookup fails the suite instead of shipping unnoticed. The counter
+hooks engine events and lives with the tests, since the application never
+counts its own queries.
+"""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@dataclass
+class QueryCount:
+    """The statements and round trips counted while a block ran.
+
+    Attributes:
+        statements: Every statement sent to the database in order, savepoint
+            commands included.
+        round_trips: Statements plus the ``BEGIN``, ``COMMIT`` and
+            ``ROLLBACK`` of their transactions.
+    """
+
+    statements: list[str] = field(default_factory=list)
+    round_trips: int = 0
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a block sends more statements or round trips than its budget allows."""
+
+    def __init__(self, count: QueryCount, statements: int, round_trips: int):
+        """Initialize the error, listing every statement so an N+1 pattern shows as a repeated one."""
+        self.count = count
+        listing = "\n".join(f"{number}. {statement}" for number, statement in enumerate(count.statements, 1))
+        super().__init__(
+            f"Sent {len(count.statements)} statements in {count.round_trips} round trips, over the budget of "
+            f"{statements} statements in {round_trips} round trips:\n{listing}"
+        )
+
+
+class QueryCounter:
+    """Count what attached engines send to the database while a block runs.
+
+    Counting covers every connection of the attached engines, not only the
+    current task, so blocks should not overlap unrelated database work.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a counter without attached engines."""
+        self._active: list[QueryCount] = []
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Count the statements and transaction commands of ``engine``."""
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._count_statement)
+        for command in ("begin", "commit", "rollback"):
+            event.listen(sync_engine, command, self._count_round_trip)
+
+    @contextmanager
+    def count(self) -> Generator[QueryCount]:
+        """Count the statements and round trips of the enclosed block."""
+        count = QueryCount()
+        self._active.append(count)
+        try:
+            yield count
+        finally:
+            self._active.remove(count)
+
+    @contextmanager
+    def budget(self, *, statements: int, round_trips: int) -> Generator[QueryCount]:
+        """Fail when the enclosed block sends more than ``statements`` statements or ``round_trips`` round trips.
+
+        Raises:
+            QueryBudgetExceeded: If the block completes over budget.
+        """
+        with self.count() as count:
+            yield count
+        if len(count.statements) > statements or count.round_trips > round_trips:
+            raise QueryBudgetExceeded(count, statements, round_trips)
+
+    def _count_statement(
+        self,
+        connection: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        """Count a statement and its round trip."""
+        for count in self._active:
+            count.statements.append(statement)
+            count.round_trips += 1
+
+    def _count_round_trip(self, connection: Connection) -> None:
+        """Count the round trip of a transaction command."""
+        for count in self._active:
+            count.round_trips += 1
@@ -0,0 +1,78 @@
+"""Test suite for the benchmark harness."""
+
+import json
+from pathlib import Path
+
+from benchmarks.harness import Baseline, Regression, Result, write_report
+
+
+class TestBaseline:
+    """Test cases for comparing benchmark results with a stored baseline."""
+
+    def test_results_below_the_floor_regress(self):
+        """
+        GIVEN a baseline with a 50% tolerance
+        WHEN results above, below and without a baseline are checked
+        THEN only the result below half its baseline regresses
+        """
+        # GIVEN
+        baseline = Baseline(operations_per_second={"fast": 1000.0, "slow": 1000.0}, tolerance=0.5)
+        results = [Result("fast", 600, 1.0), Result("slow", 400, 1.0), Result("new", 1, 1.0)]
+
+        # WHEN
+        regressions = baseline.check(results)
+
+        # THEN
+        assert regressions == [Regression("slow", 400.0, 500.0)]
+
+    def test_updated_baseline_round_trips_through_a_file(self, tmp_path: Path):
+        """
+        GIVEN a stored baseline and a new result
+        WHEN the baseline is updated, saved and loaded again
+        THEN it keeps old entries and records the new one to three significant digits
+        """
+        # GIVEN
+        path = tmp_path / "baseline.json"
+        Baseline(operations_per_second={"kept": 10.0}, tolerance=0.25).save(path)
+
+        # WHEN
+        Baseline.load(path).updated([Result("measured", 123_456, 1.0)]).save(path)
+
+        # THEN
+        assert Baseline.load(path) == Baseline(
+            operations_per_second={"kept": 10.0, "measured": 123_000.0}, tolerance=0.25
+        )
+
+    def test_missing_baseline_file_holds_no_baselines(self, tmp_path: Path):
+        """
+        GIVEN no baseline file
+        WHEN the baseline is loaded
+        THEN no benchmark has a floor
+        """
+        # WHEN
+        baseline = Baseline.load(tmp_path / "missing.json")
+
+        # THEN
+        assert baseline.floor("anything") is None
+
+
+class TestReport:
+    """Test cases for the JSON benchmark report."""
+
+    def test_report_flags_regressed_results(self, tmp_path: Path):
+        """
+        GIVEN a result below its baseline floor
+        WHEN the report is written into a missing directory
+        THEN the directory is created and the result is flagged with its floor
+        """
+        # GIVEN
+        path = tmp_path / "reports" / "benchmarks.json"
+        baseline = Baseline(operations_per_second={"slow": 1000.0})
+
+        # WHEN
+        write_report(path, [Result("slow", 100, 1.0)], baseline)
+
+        # THEN
+        [result] = json.loads(path.read_text())["results"]
+        assert result["floor"] == 500.0
+        assert result["regressed"] is True